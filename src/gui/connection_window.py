@@ -29,6 +29,13 @@ from gui.console_window import ConsoleWindow
 from gui.updater_window import UpdaterWindow
 from resources.indexer import ConsoleIndex, BackgroundIndex, OTAIndex
 from resources.patterns import *
+
+# Console name request, sent once per console on connection
+ARCTIC_COMMAND_GET_NAME = b"ARCTIC_COMMAND_GET_NAME"
+ARCTIC_COMMAND_REQ_NAME = b"ARCTIC_COMMAND_REQ_NAME:" # Prefix of the reply
+
+# Seconds to wait for the consoles names before opening the windows
+CONSOLE_NAME_TIMEOUT = 5
 		
 class ConnectionWindow(QWidget):
 	signal_closing_complete = pyqtSignal()
@@ -54,12 +61,13 @@ class ConnectionWindow(QWidget):
 		self.ble_handler.notificationReceived.connect(self.callback_handle_notification)
 		
 		# Async Events from the device
-		self.get_name_event = asyncio.Event()
+		self.get_name_events = {} # One per console, by status characteristic uuid
 
 		# Globals
 		self.background_service = None # Background service reference (for service reuse)
 		self.updater_service = None # Updater service reference (for service reuse)
 		self.console_services = {} # Console services reference (for service reuse)
+		self.console_txs_index = {} # Console services by status characteristic uuid (for notification lookup)
 		self.updater_ref = None # Updater window reference (for window reuse)
 		self.console_ref = {} # Console windows reference (for window reuse)
 		self.last_device_address = None
@@ -117,7 +125,7 @@ class ConnectionWindow(QWidget):
 			self.main_window.debug_info("No device selected")
 			return
 		
-		device_address = selected_items[0].text().split(" - ")[1]
+		device_address = selected_items[0].text().rpartition(" - ")[2]
 		self.last_device_address = device_address
 
 		if not reconnect:
@@ -136,23 +144,40 @@ class ConnectionWindow(QWidget):
 				await self.ble_handler.startNotifications(self.updater_service.tx_characteristic)
 			self.new_updater_window(self.updater_service.name, self.updater_service.service.uuid)
 
-		# Load consoles windows
+		# Request all consoles names, a previous setup still waiting keeps its own events until its timeout
+		name_events = self.get_name_events = {}
 		for service_uuid, indexer in self.console_services.items():
 
 			# Start notifications
 			if indexer.tx_characteristic:
 				await self.ble_handler.startNotifications(indexer.tx_characteristic)
-			if indexer.txs_characteristic:
-				await self.ble_handler.startNotifications(indexer.txs_characteristic)
+			if not indexer.txs_characteristic:
+				self.main_window.debug_log(f"Console {service_uuid} has no status characteristic, skipped")
+				continue
+			await self.ble_handler.startNotifications(indexer.txs_characteristic)
 			
 			# Retreive console name from device
-			self.get_name_event.clear()
+			name_events[indexer.txs_characteristic.uuid] = asyncio.Event()
 			await self.ble_handler.writeCharacteristic( # Request name
 				indexer.rx_characteristic.uuid,
-				str(f"ARCTIC_COMMAND_GET_NAME").encode()
+				ARCTIC_COMMAND_GET_NAME
 			)
-			await self.get_name_event.wait() # Wait for the name to be retrieved
-			self.new_console_window(indexer.name, service_uuid)
+
+		# Wait for the names to be retrieved, replies overlap instead of one round trip per console
+		if name_events:
+			waiters = [asyncio.ensure_future(event.wait()) for event in name_events.values()]
+			_, pending = await asyncio.wait(waiters, timeout=CONSOLE_NAME_TIMEOUT)
+			for task in pending:
+				task.cancel()
+
+		# Load consoles windows, only for the names that arrived
+		for service_uuid, indexer in self.console_services.items():
+			if not indexer.txs_characteristic:
+				continue
+			if name_events[indexer.txs_characteristic.uuid].is_set():
+				self.new_console_window(indexer.name, service_uuid)
+			else:
+				self.main_window.debug_log(f"Console {service_uuid} did not send its name")
 
 	# Reconnection
 	@qasync.asyncSlot()
@@ -218,11 +243,14 @@ class ConnectionWindow(QWidget):
 	
 	# Callback handle notification for retrieving console name
 	def callback_handle_notification(self, uuid, value):
-		for service_uuid, indexer in self.console_services.items():
-			if indexer.txs_characteristic.uuid == uuid:
-				value = value.replace("ARCTIC_COMMAND_REQ_NAME:", "") # Remove command
-				self.console_services[service_uuid].name = value
-				self.get_name_event.set()
+		indexer = self.console_txs_index.get(uuid)
+		if indexer:
+			if value.startswith(ARCTIC_COMMAND_REQ_NAME):
+				value = value[len(ARCTIC_COMMAND_REQ_NAME):] # Remove command
+			value = value.decode('utf-8', errors='replace')
+			indexer.name = value
+			if uuid in self.get_name_events:
+				self.get_name_events[uuid].set()
 		
 	# Window Functions ------------------------------------------------------------------------------------------
 
@@ -267,7 +295,7 @@ class ConnectionWindow(QWidget):
 				self.updater_service = temp_indexer
 
 			# Register console services
-			if service_console_pattern.match(service_uuid):
+			if service_console_match(service_uuid):
 				self.main_window.debug_log("Console service found")
 			
 				# Check if the service is already registered and reuse it
@@ -281,16 +309,18 @@ class ConnectionWindow(QWidget):
 					char_uuid = str(characteristic.uuid)
 
 					# Check and update or set characteristics
-					if char_tx_pattern.match(char_uuid):
+					if char_tx_match(char_uuid):
 						temp_indexer.tx_characteristic = characteristic
-					elif char_txs_pattern.match(char_uuid):
+					elif char_txs_match(char_uuid):
 						temp_indexer.txs_characteristic = characteristic
-					elif char_rx_pattern.match(char_uuid):
+					elif char_rx_match(char_uuid):
 						temp_indexer.rx_characteristic = characteristic
 
 				# Register the temp_indexer
 				temp_indexer.name = "<arctic>"
 				self.console_services[service_uuid] = temp_indexer
+				if temp_indexer.txs_characteristic:
+					self.console_txs_index[temp_indexer.txs_characteristic.uuid] = temp_indexer
 
 		# Setup notification and read name characteristic
 		self.setup_consoles()
@@ -17,16 +17,22 @@
 #
 
 import qasync
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QLineEdit, QPushButton, QPlainTextEdit, QApplication, QVBoxLayout, QHBoxLayout, QWidget, QFileDialog, QTextEdit
 from PyQt5.QtGui import QTextCursor, QFont, QTextCharFormat
 from datetime import datetime
+from collections import deque
 
 from interfaces.bluetooth.ble_handler import BLEHandler
 from resources.indexer import ConsoleIndex
 from helpers.pushbutton_helper import ToggleButton, SimpleButton
 from resources.theme_config import *
-import helpers.theme_helper as th
+
+# Maximum number of lines kept in the console
+CONSOLE_LINE_LIMIT = 1000
+
+# Inputs are accumulated and shown in the console at most once per interval (ms)
+CONSOLE_FLUSH_INTERVAL = 10
 
 class ConsoleWindow(QWidget):
 	def __init__(self, main_window, ble_handler: BLEHandler, title, console_index: ConsoleIndex):
@@ -58,12 +64,22 @@ class ConsoleWindow(QWidget):
 		self.console_paused = False
 		self.logging_enabled = False
 		self.user_log_path = None
+		self.log_file = None # Open while logging is enabled
 
 		self.total_lines = 0
 		self.total_bytes_received = 0
 		self.last_received_timestamp = 0
+		self.last_input_delta = None # Time between the last two inputs
 		self.total_data_counter = 0
 
+		# Inputs waiting to be flushed into the console
+		self.pending_data = deque()
+		self.pending_size = 0
+		self.flush_timer = QTimer(self)
+		self.flush_timer.setSingleShot(True)
+		self.flush_timer.setInterval(CONSOLE_FLUSH_INTERVAL)
+		self.flush_timer.timeout.connect(self.flush_data)
+
 		self.setup_layout()
 
 	# GUI Functions ------------------------------------------------------------------------------------------
@@ -87,7 +103,6 @@ class ConsoleWindow(QWidget):
 		self.lock_button = ToggleButton(self,
 			icons=(f"{self.icons_dir}/lock_open_right_FILL0_wght400_GRAD0_opsz24.svg", f"{self.icons_dir}/lock_FILL0_wght400_GRAD0_opsz24.svg"),
 			size=(DEFAULT_PUSH_BUTTON_HEIGHT, DEFAULT_PUSH_BUTTON_HEIGHT),
-			style=th.get_style("default_button_style"),
 			callback=self.toggle_lock,
 			toggled=True
 		)
@@ -97,11 +112,12 @@ class ConsoleWindow(QWidget):
 		self.text_edit_printf.setFont(QFont("Inconsolata"))
 		self.text_edit_printf.installEventFilter(self)
 		self.text_edit_printf.setReadOnly(True)
+		self.text_edit_printf.setMaximumBlockCount(CONSOLE_LINE_LIMIT) # Oldest lines are dropped by the document
 		
 		# Create an overlay
 		self.status_overlay = QLineEdit(self)
 		self.status_overlay.setFont(QFont("Inconsolata"))
-		self.status_overlay.setStyleSheet(th.get_style("console_status_line_edit_style"))
+		self.status_overlay.setObjectName("console_status_line_edit")
 		self.status_overlay.setGeometry(self.text_edit_printf.geometry())
 		self.status_overlay.setReadOnly(True)
 		self.status_overlay.setAlignment(Qt.AlignCenter)
@@ -128,14 +144,13 @@ class ConsoleWindow(QWidget):
 		self.line_edit_send = QLineEdit(self)
 		self.line_edit_send.setFont(QFont("Inconsolata"))
 		self.line_edit_send.setFixedHeight(DEFAULT_LINE_EDIT_HEIGHT)
-		self.line_edit_send.setStyleSheet(th.get_style("console_send_line_edit_style"))
+		self.line_edit_send.setObjectName("console_send_line_edit")
 		self.line_edit_send.setPlaceholderText("Insert data to send ...")
 
 		# Simple send button
 		self.send_button = SimpleButton(self,
 			icon=f"{self.icons_dir}/play_arrow_FILL0_wght400_GRAD0_opsz24.svg",
 			size=(DEFAULT_PUSH_BUTTON_HEIGHT, DEFAULT_PUSH_BUTTON_HEIGHT),
-			style=th.get_style("default_button_style"),
 			callback=self.send_data
 		)
 
@@ -190,19 +205,19 @@ class ConsoleWindow(QWidget):
 	# Callback connection success
 	def callback_connection_complete(self, connected):
 		if connected:
-			self.update_data(f"[ {self.main_window.default_title}: Remote device connected ]\n")
+			self.queue_data(f"[ {self.main_window.default_title}: Remote device connected ]\n")
 	
 	# Callback device disconnected
 	def callback_disconnected(self, client):
-		self.update_data(f"[ {self.main_window.default_title}: Remote device disconnected ]\n")
+		self.queue_data(f"[ {self.main_window.default_title}: Remote device disconnected ]\n")
 
 	# Callback handle input notification
 	def callback_handle_notification(self, sender, data):
 		# Redirect the data to the printf text box
 		if sender == self.console_index.tx_characteristic.uuid:
-			self.update_data(data)
+			self.queue_data(data.decode('utf-8', errors='replace'), len(data))
 		elif sender == self.console_index.txs_characteristic.uuid:
-			self.update_info(data)
+			self.update_info(data.decode('utf-8', errors='replace'))
 
 	# Window Functions ------------------------------------------------------------------------------------------
 
@@ -221,11 +236,10 @@ class ConsoleWindow(QWidget):
 
 	# Overlay text
 	def update_status(self):
-		current_time = datetime.now()
 
 		# Calculate latency in milliseconds
-		if self.last_received_timestamp:
-			latency = int((current_time - self.last_received_timestamp).total_seconds() * 1000)
+		if self.last_input_delta is not None:
+			latency = int(self.last_input_delta.total_seconds() * 1000)
 			latency_text = f"{latency:3.0f} ms"
 		else:
 			latency_text = "N/A"
@@ -238,12 +252,34 @@ class ConsoleWindow(QWidget):
 		
 		self.status_overlay.setText(status_text)
 
-	def update_data(self, data, line_limit=1000):
+	# Queue new data, all inputs received within the flush interval are shown at once
+	def queue_data(self, data, size=None):
+		# Inputs are timed when they arrive, not when the batch is shown
+		if not self.console_paused:
+			received_time = datetime.now()
+			if self.last_received_timestamp:
+				self.last_input_delta = received_time - self.last_received_timestamp
+			self.last_received_timestamp = received_time
+
+		self.pending_data.append(data)
+		self.pending_size += size if size is not None else len(data.encode('utf-8'))
+		if not self.flush_timer.isActive():
+			self.flush_timer.start()
+
+	def flush_data(self):
+		data = "".join(self.pending_data)
+		inputs = len(self.pending_data)
+		size = self.pending_size
+		self.pending_data.clear()
+		self.pending_size = 0
+		self.update_data(data, size, inputs)
+
+	def update_data(self, data, size, inputs=1):
 		if self.console_paused:
 			return
 
 		# New data received - update metrics
-		self.total_bytes_received += len(data.encode('utf-8'))
+		self.total_bytes_received += size
 
 		# Save the current position of the scrollbar
 		scrollbar = self.text_edit_printf.verticalScrollBar()
@@ -260,20 +296,13 @@ class ConsoleWindow(QWidget):
 		self.text_edit_printf.insertPlainText(data)
 
 		# Log the data if logging is enabled
-		if self.logging_enabled and self.user_log_path:
+		if self.log_file:
 			try:
-				with open(self.user_log_path, 'a') as log_file:
-					log_file.write(data)
+				self.log_file.write(data)
+				self.log_file.flush()
 			except Exception as e:
 				self.main_window.debug_log(f"Error writing to log file: {e}")
 
-		# Limit the number of lines
-		text = self.text_edit_printf.toPlainText()
-		lines = text.split('\n')
-		if len(lines) > line_limit:
-			lines = lines[-line_limit:]
-			self.text_edit_printf.setPlainText('\n'.join(lines))
-
 		# Scroll to the bottom if the lock button is pressed
 		if self.scroll_locked:
 			scrollbar.setValue(scrollbar.maximum())
@@ -282,16 +311,15 @@ class ConsoleWindow(QWidget):
 		
 		# Increment the tab counter
 		if not self.check_tab_focus():
-			self.data_tab_counter += 1
+			self.data_tab_counter += inputs
 			self.update_tab_title()
 
 		# Update the total lines
-		self.total_data_counter += 1
-		self.total_lines = len(self.text_edit_printf.toPlainText().split('\n'))
+		self.total_data_counter += inputs
+		self.total_lines = self.text_edit_printf.blockCount()
 		
 		# Update stats bar
 		self.update_status()
-		self.last_received_timestamp = datetime.now()
 
 	# Update the info text box (singlef)
 	def update_info(self, info):
@@ -319,18 +347,38 @@ class ConsoleWindow(QWidget):
 		self.total_lines = 0
 		self.total_bytes_received = 0
 		self.last_received_timestamp = 0
+		self.last_input_delta = None
 		self.total_data_counter = 0
 		self.update_status()
 	
 	# Save the text from the main text box
 	def log_text(self):
 		if not self.logging_enabled:
-			if self.select_log_file():
+			if self.select_log_file() and self.open_log_file():
 				self.logging_enabled = True
 				self.log_button.setStyleSheet("color: #ffffff; background-color: rgba(0, 100, 0, 128)")
 		else:
-			self.logging_enabled = False
-			self.log_button.setStyleSheet(th.get_style("default_button_style"))
+			self.stop_logging()
+
+	# Close the log file and show the log button as off
+	def stop_logging(self):
+		self.logging_enabled = False
+		self.close_log_file()
+		self.log_button.setStyleSheet("") # Back to the application style
+
+	# Keep the log file open while logging, instead of reopening it for every input
+	def open_log_file(self):
+		try:
+			self.log_file = open(self.user_log_path, 'a')
+			return True
+		except Exception as e:
+			self.main_window.debug_log(f"Error opening log file: {e}")
+			return False
+
+	def close_log_file(self):
+		if self.log_file:
+			self.log_file.close()
+			self.log_file = None
 
 	def select_log_file(self):
 		# Use the native file dialog
@@ -341,14 +389,6 @@ class ConsoleWindow(QWidget):
 		return False
 	
 	def callback_update_theme(self, theme):
-		# Reload stylesheets (background for buttons)
-		self.line_edit_send.setStyleSheet(th.get_style("console_send_line_edit_style"))
-		if not self.logging_enabled:
-			self.log_button.setStyleSheet(th.get_style("default_button_style"))
-		self.lock_button.setStyleSheet(th.get_style("default_button_style"))
-		self.send_button.setStyleSheet(th.get_style("default_button_style"))
-		self.status_overlay.setStyleSheet(th.get_style("console_status_line_edit_style"))
-
 		# Update special widgets by theme
 		if theme == "dark":
 			self.lock_button.changeIconColor("#ffffff")
@@ -363,6 +403,10 @@ class ConsoleWindow(QWidget):
 		self.set_overlay_geometry()
 		super().resizeEvent(event)
 
+	def closeEvent(self, event):
+		self.stop_logging() # The window is reused on reconnect, logging must be enabled again
+		super().closeEvent(event)
+
 	# Reimplement the keyPressEvent
 	def keyPressEvent(self, event):
 		if event.key() == Qt.Key_Return or event.key() == Qt.Key_Enter:
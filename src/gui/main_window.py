@@ -21,7 +21,7 @@ import time
 from pathlib import Path
 
 from PyQt5.QtCore import Qt, pyqtSignal, QSize
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QTabWidget, QLineEdit, QHBoxLayout, QPushButton
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QTabWidget, QLineEdit, QHBoxLayout, QPushButton, QSizePolicy
 from PyQt5.QtGui import QFontDatabase, QFont, QIcon
 
 from interfaces.bluetooth.ble_handler import BLEHandler
@@ -33,17 +33,6 @@ from helpers.pushbutton_helper import SimpleButton
 from resources.theme_config import *
 import helpers.theme_helper as th
 
-# Default styles
-default_style_names = [
-	"default_app_style",
-	"default_button_style",
-	"default_line_edit_style",
-	"default_text_edit_style",
-	"default_ptext_edit_style",
-	"default_tab_style",
-	"default_scroll_style"
-]
-
 class MainWindow(SSCWindowProperties):
 	themeChanged = pyqtSignal(str)
 
@@ -66,7 +55,7 @@ class MainWindow(SSCWindowProperties):
 		self.setMinimumSize(*self.minimum_size)
 
 		# Set the stylesheet
-		app_main.setStyleSheet(th.get_style(default_style_names))
+		app_main.setStyleSheet(th.get_app_style())
 		self.setWindowIcon(QIcon(f"{self.icon_path()}/main_icon.png"))
 
 		# Load the font file (.ttf or .otf)
@@ -98,7 +87,7 @@ class MainWindow(SSCWindowProperties):
 		# Single line text area for displaying debug info
 		self.line_edit_debug = QLineEdit(self)
 		self.line_edit_debug.setFixedHeight(DEBUG_LINE_EDIT_HEIGHT)
-		self.line_edit_debug.setStyleSheet(th.get_style("debug_bar_line_edit_style"))
+		self.line_edit_debug.setObjectName("debug_bar_line_edit")
 		self.line_edit_debug.setReadOnly(True)
 		self.line_edit_debug.setVisible(self.debug_show)
 		self.line_edit_debug.setText(">")
@@ -108,7 +97,7 @@ class MainWindow(SSCWindowProperties):
 		self.line_edit_version.setAlignment(Qt.AlignCenter)
 		self.line_edit_version.setFixedWidth(80)
 		self.line_edit_version.setFixedHeight(DEBUG_LINE_EDIT_HEIGHT)
-		self.line_edit_version.setStyleSheet(th.get_style("debug_bar_line_edit_style"))
+		self.line_edit_version.setObjectName("debug_bar_line_edit")
 		self.line_edit_version.setReadOnly(True)
 		self.line_edit_version.setVisible(self.debug_show)
 		self.line_edit_version.setText(self.app_version)
@@ -116,33 +105,36 @@ class MainWindow(SSCWindowProperties):
 		# Connector BLE button
 		self.ble_button = SimpleButton(self,
 			icon=f"{self.icons_dir}/bluetooth_FILL0_wght300_GRAD0_opsz24.svg",
-			style=th.get_style("connectors_button_style"),
 			callback=self.connect_ble
 		)
+		self.ble_button.setObjectName("connectors_button")
 		self.ble_button.setIconSize(QSize(CONNECTORS_ICON_SIZE,CONNECTORS_ICON_SIZE))
+		self.ble_button.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Expanding) # Fills the free height
 
 		# Connector USB button
 		self.usb_button = SimpleButton(self,
 			icon=f"{self.icons_dir}/usb_FILL0_wght300_GRAD0_opsz24.svg",
-			style=th.get_style("connectors_button_style"),
 			callback=self.connect_usb
 		)
+		self.usb_button.setObjectName("connectors_button")
 		self.usb_button.setIconSize(QSize(CONNECTORS_ICON_SIZE,CONNECTORS_ICON_SIZE))
+		self.usb_button.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Expanding) # Fills the free height
 
 		# Connector WiFi button
 		self.wifi_button = SimpleButton(self,
 			icon=f"{self.icons_dir}/wifi_FILL0_wght300_GRAD0_opsz24.svg",
-			style=th.get_style("connectors_button_style"),
 			callback=self.connect_wifi
 		)
+		self.wifi_button.setObjectName("connectors_button")
 		self.wifi_button.setIconSize(QSize(CONNECTORS_ICON_SIZE,CONNECTORS_ICON_SIZE))
+		self.wifi_button.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Expanding) # Fills the free height
 		
 		self.ble_descriptor = QPushButton("Bluetooth", self)
-		self.ble_descriptor.setStyleSheet(th.get_style("connectors_desc_button_style"))
+		self.ble_descriptor.setObjectName("connectors_desc_button")
 		self.usb_descriptor = QPushButton("USB", self)
-		self.usb_descriptor.setStyleSheet(th.get_style("connectors_desc_button_style"))
+		self.usb_descriptor.setObjectName("connectors_desc_button")
 		self.wifi_descriptor = QPushButton("Wifi", self)
-		self.wifi_descriptor.setStyleSheet(th.get_style("connectors_desc_button_style"))
+		self.wifi_descriptor.setObjectName("connectors_desc_button")
 
 		connectors_layout = QHBoxLayout()
 		connectors_layout.addWidget(self.ble_button)
@@ -218,11 +210,11 @@ class MainWindow(SSCWindowProperties):
 	def set_status_bar(self, mode):
 		if mode == "Connected":
 			self.setStyleSheet("MainWindow {border: 2px solid rgba(0, 100, 0, 128);}")
-			self.con_status_button.setStyleSheet("font-size: 13px; color: white; background-color: rgba(0, 100, 0, 128); border-radius: 0px;")
+			th.set_style_state(self.con_status_button, "status", "connected")
 			self.con_status_button.setText("Connected")
 		elif mode == "Disconnected":
 			self.setStyleSheet("MainWindow {border: 2px solid rgba(139, 0, 0, 128);}")
-			self.con_status_button.setStyleSheet("font-size: 13px; color: white; background-color: rgba(139, 0, 0, 128); border-radius: 0px;")
+			th.set_style_state(self.con_status_button, "status", "disconnected")
 			self.con_status_button.setText("Disconnected")
 
 	# Get the icon path
@@ -268,17 +260,7 @@ class MainWindow(SSCWindowProperties):
 			self.theme_status = "dark"
 
 		th.toggle_theme() # Update global theme
-		QApplication.instance().setStyleSheet(th.get_style(default_style_names))
-		self.ble_button.setStyleSheet(th.get_style("connectors_button_style"))
-		self.usb_button.setStyleSheet(th.get_style("connectors_button_style"))
-		self.wifi_button.setStyleSheet(th.get_style("connectors_button_style"))
-
-		self.ble_descriptor.setStyleSheet(th.get_style("connectors_desc_button_style"))
-		self.usb_descriptor.setStyleSheet(th.get_style("connectors_desc_button_style"))
-		self.wifi_descriptor.setStyleSheet(th.get_style("connectors_desc_button_style"))
-		
-		self.line_edit_debug.setStyleSheet(th.get_style("debug_bar_line_edit_style"))
-		self.line_edit_version.setStyleSheet(th.get_style("debug_bar_line_edit_style"))
+		QApplication.instance().setStyleSheet(th.get_app_style()) # Single sheet for every window
 
 		# Update special widgets by theme
 		if self.theme_status == "dark":
@@ -290,7 +272,7 @@ class MainWindow(SSCWindowProperties):
 			self.usb_button.changeIconColor("#303030")
 			self.wifi_button.changeIconColor("#303030")
 		
-		# Update children widgets
+		# Update children widgets, their stylesheets already follow the application sheet so only rendered icons need updating
 		self.themeChanged.emit(self.theme_status)
 	
 	def toggle_debug(self):
@@ -36,6 +36,9 @@ import helpers.theme_helper as th
 # Really *spammy* output
 OTA_ENABLE_OUTPUT_DEBUG = False
 
+# Read size used when hashing firmware files
+HASH_BUFFER_SIZE = 64 * 1024
+
 class UpdaterWindow(QWidget):
 	def __init__(self, main_window, ble_handler: BLEHandler, title, updater_index: OTAIndex):
 		super().__init__()
@@ -73,7 +76,6 @@ class UpdaterWindow(QWidget):
 		self.mtu_size = 500
 		self.start_time = 0
 		self.elapsed_str = "00:00:00"
-		self.ota_error_status = False
 		self.icons_dir = self.main_window.icon_path()
 
 		self.setup_layout()
@@ -97,7 +99,6 @@ class UpdaterWindow(QWidget):
 		self.folder_button = SimpleButton(self,
 			icon=f"{self.icons_dir}/drive_folder_upload_FILL0_wght400_GRAD0_opsz24.svg",
 			size=(DEFAULT_PUSH_BUTTON_HEIGHT, DEFAULT_PUSH_BUTTON_HEIGHT),
-			style=th.get_style("default_button_style"),
 			callback=self.setPath
 		)
 
@@ -110,7 +111,7 @@ class UpdaterWindow(QWidget):
 		self.drag_placeholder = QLineEdit("Drag your firmware here or select your firmware path", self)
 		self.drag_placeholder.setFont(QFont("Inconsolata"))
 		self.drag_placeholder.setGeometry(self.text_edit_printf.geometry())
-		self.drag_placeholder.setStyleSheet(th.get_style("updater_placeholder_line_edit_style"))
+		self.drag_placeholder.setObjectName("updater_placeholder_line_edit")
 		self.drag_placeholder.setReadOnly(True)
 		self.drag_placeholder.setAlignment(Qt.AlignCenter)
 		self.drag_placeholder.setAttribute(Qt.WA_TransparentForMouseEvents)
@@ -126,7 +127,6 @@ class UpdaterWindow(QWidget):
 		# Create the progress bar
 		self.progress_bar = QProgressBar(self)
 		self.progress_bar.setFixedHeight(DEFAULT_LOADING_BAR_HEIGHT)
-		self.progress_bar.setStyleSheet(th.get_style("default_loading_bar_style"))
 		self.progress_bar.setMaximum(100)
 		self.progress_bar.setValue(0)
 
@@ -155,22 +155,9 @@ class UpdaterWindow(QWidget):
 		self.drag_placeholder.setVisible(visible)
 
 	def highlight_drag_box(self, highlight):
-		if highlight:
-			self.text_edit_printf.setStyleSheet(th.get_style("updater_highligh_ptext_edit_style"))
-		else:
-			self.text_edit_printf.setStyleSheet(th.get_style("default_text_edit_style"))
+		th.set_style_state(self.text_edit_printf, "highlight", highlight)
 	
 	def callback_update_theme(self, theme):
-		# Reload stylesheets (background for buttons)
-		self.folder_button.setStyleSheet(th.get_style("default_button_style"))
-		self.drag_placeholder.setStyleSheet(th.get_style("updater_placeholder_line_edit_style"))
-		self.text_edit_printf.setStyleSheet(th.get_style("default_text_edit_style"))
-
-		if (self.ota_error_status): # If in error state
-			self.progress_bar.setStyleSheet(th.get_style("uploader_loading_bar_fail_style"))
-		else:
-			self.progress_bar.setStyleSheet(th.get_style("default_loading_bar_style"))
-
 		# Update special widgets by theme
 		if theme == "dark":
 			self.folder_button.changeIconColor("#ffffff")
@@ -233,9 +220,8 @@ class UpdaterWindow(QWidget):
 	def initialize_ota(self):
 		self.start_time = datetime.now()
 		self.ota_running = True
-		self.ota_error_status = False
 		self.clear_events()
-		self.progress_bar.setStyleSheet(th.get_style("default_loading_bar_style"))
+		th.set_style_state(self.progress_bar, "failed", False)
 		self.progress_bar.setValue(0)
 
 	def clear_events(self):
@@ -282,8 +268,7 @@ class UpdaterWindow(QWidget):
 			# Check if a disconnect event occurred
 			if self.disconnect_event.is_set():
 				self.main_window.debug_log("OTA update aborted due to disconnection.")
-				self.progress_bar.setStyleSheet(th.get_style("uploader_loading_bar_fail_style"))
-				self.ota_error_status = True
+				th.set_style_state(self.progress_bar, "failed", True)
 				self.ota_running = False
 				return
 
@@ -311,8 +296,7 @@ class UpdaterWindow(QWidget):
 		while retries < max_retries:
 			if self.disconnect_event.is_set():
 				self.main_window.debug_log("OTA update aborted due to disconnection.")
-				self.progress_bar.setStyleSheet(th.get_style("uploader_loading_bar_fail_style"))
-				self.ota_error_status = True
+				th.set_style_state(self.progress_bar, "failed", True)
 				self.ota_running = False
 				return False
 
@@ -322,8 +306,7 @@ class UpdaterWindow(QWidget):
 			retries += 1
 
 		self.main_window.debug_log("Maximum retries reached, stopping OTA")
-		self.progress_bar.setStyleSheet(th.get_style("uploader_loading_bar_fail_style"))
-		self.ota_error_status = True
+		th.set_style_state(self.progress_bar, "failed", True)
 		self.ota_running = False
 		return False
 
@@ -344,6 +327,10 @@ class UpdaterWindow(QWidget):
 			return_when=asyncio.FIRST_COMPLETED
 		)
 
+		# Drop the waiters left behind, otherwise one accumulates for every chunk sent
+		for task in pending:
+			task.cancel()
+
 		if self.stop_event.is_set():
 			self.handle_stop_event()
 			return False
@@ -358,19 +345,16 @@ class UpdaterWindow(QWidget):
 	def handle_stop_event(self):
 		if self.success_event.is_set():
 			self.update_info(f"[{self.elapsed_str}] OTA Loading completed")
-			self.progress_bar.setStyleSheet(th.get_style("default_loading_bar_style"))
+			th.set_style_state(self.progress_bar, "failed", False)
 		elif self.error_event.is_set():
-			self.progress_bar.setStyleSheet(th.get_style("uploader_loading_bar_fail_style"))
+			th.set_style_state(self.progress_bar, "failed", True)
 			self.update_info(f"[{self.elapsed_str}] OTA Error received")
-			self.ota_error_status = True
 		elif self.disconnect_event.is_set():
-			self.progress_bar.setStyleSheet(th.get_style("uploader_loading_bar_fail_style"))
+			th.set_style_state(self.progress_bar, "failed", True)
 			self.update_info(f"[{self.elapsed_str}] OTA Device disconnected")
-			self.ota_error_status = True
 		else:
-			self.progress_bar.setStyleSheet(th.get_style("uploader_loading_bar_fail_style"))
+			th.set_style_state(self.progress_bar, "failed", True)
 			self.update_info(f"[{self.elapsed_str}] OTA Loading aborted")
-			self.ota_error_status = True
 
 		self.ota_running = False
 
@@ -385,7 +369,7 @@ class UpdaterWindow(QWidget):
 
 		# Redirect the data to the printf text box
 		if sender == self.updater_index.tx_characteristic.uuid:
-			self.update_info(data)
+			self.update_info(data.decode('utf-8', errors='replace'))
 
 	def callback_disconnected(self, client):
 		if self.ota_running:
@@ -481,7 +465,12 @@ class UpdaterWindow(QWidget):
 	# Calculate the hash of a file
 	def calculate_hash(self, file_path, hashType='md5'):
 		hashFunc = getattr(hashlib, hashType)()
+		buffer = bytearray(HASH_BUFFER_SIZE) # Reused for every read, no per-chunk allocation
+		view = memoryview(buffer)
 		with open(file_path, 'rb') as file:
-			for chunk in iter(lambda: file.read(4096), b""):
-				hashFunc.update(chunk)
+			while True:
+				size = file.readinto(buffer)
+				if not size:
+					break
+				hashFunc.update(view[:size])
 		return hashFunc.hexdigest()
\ No newline at end of file
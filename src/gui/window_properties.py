@@ -22,7 +22,6 @@ from PyQt5.QtGui import QPainter, QPolygon, QColor
 
 from helpers.pushbutton_helper import ToggleButton, SimpleButton
 from resources.theme_config import *
-import helpers.theme_helper as th
 
 class SSCWindowProperties(QMainWindow):
 	signal_window_close = pyqtSignal()
@@ -49,7 +48,7 @@ class SSCWindowProperties(QMainWindow):
 
 		self.custom_bar_widget = QWidget(self)
 		self.custom_bar_widget.setFixedHeight(CUSTOM_BAR_HEIGHT)
-		self.custom_bar_widget.setStyleSheet(th.get_style("custom_bar_widget_style"))
+		self.custom_bar_widget.setObjectName("custom_bar_widget")
 
 		custom_bar_layout = QHBoxLayout()
 		custom_bar_layout.setContentsMargins(0, 0, 0, 0)
@@ -59,9 +58,9 @@ class SSCWindowProperties(QMainWindow):
 		self.logo_button = SimpleButton(self,
 			icon=f"{self.icons_dir}/chevron_right_FILL0_wght400_GRAD0_opsz24.svg",
 			size=(CUSTOM_BAR_HEIGHT, CUSTOM_BAR_HEIGHT),
-			style=th.get_style("custom_bar_button_style"),
 			callback=self.toggle_debug
 		)
+		self.logo_button.setObjectName("custom_bar_button")
 
 		# Title label
 		self.title_label = QLabel(title)
@@ -71,22 +70,23 @@ class SSCWindowProperties(QMainWindow):
 		self.color_mode_button = ToggleButton(self,
 			icons=(f"{self.icons_dir}/dark_mode_FILL0_wght400_GRAD0_opsz24.svg", f"{self.icons_dir}/light_mode_FILL0_wght400_GRAD0_opsz24.svg"),
 			size=(CUSTOM_BAR_HEIGHT, CUSTOM_BAR_HEIGHT),
-			style=th.get_style("custom_bar_button_style"),
 			callback=self.toggle_theme,
 			toggled=False
 		)
+		self.color_mode_button.setObjectName("custom_bar_button")
 
 		# Toggle hint button
 		self.top_hint_button = ToggleButton(self,
 			icons=(f"{self.icons_dir}/move_down_FILL0_wght400_GRAD0_opsz24.svg", f"{self.icons_dir}/move_up_FILL0_wght400_GRAD0_opsz24.svg"),
 			size=(CUSTOM_BAR_HEIGHT, CUSTOM_BAR_HEIGHT),
-			style=th.get_style("custom_bar_button_style"),
 			callback=self.toggle_hint,
 			toggled=False
 		)
+		self.top_hint_button.setObjectName("custom_bar_button")
 
 		# Status text with colored background
 		self.con_status_button = TriangleButton()
+		self.con_status_button.setObjectName("con_status_button") # Background pinned by state, no hover highlight
 		self.con_status_button.setTriangleColor("#333333")
 		self.con_status_button.setFixedSize(150, CUSTOM_BAR_HEIGHT)
 
@@ -94,26 +94,26 @@ class SSCWindowProperties(QMainWindow):
 		self.minimize_button = SimpleButton(self,
 			icon=f"{self.icons_dir}/minimize_FILL0_wght400_GRAD0_opsz24.svg",
 			size=(CUSTOM_BAR_HEIGHT, CUSTOM_BAR_HEIGHT),
-			style=th.get_style("custom_bar_button_style"),
 			callback=self.toggle_minimize
 		)
+		self.minimize_button.setObjectName("custom_bar_button")
 
 		# Toggle fullscreen button
 		self.fullscreen_button = ToggleButton(self,
 			icons=(f"{self.icons_dir}/expand_content_FILL0_wght400_GRAD0_opsz24.svg", f"{self.icons_dir}/collapse_content_FILL0_wght400_GRAD0_opsz24.svg"),
 			size=(CUSTOM_BAR_HEIGHT, CUSTOM_BAR_HEIGHT),
-			style=th.get_style("custom_bar_button_style"),
 			callback=self.fullscreen,
 			toggled=False
 		)
+		self.fullscreen_button.setObjectName("custom_bar_button")
 
 		# Simple close button
 		self.close_button = SimpleButton(self,
 			icon=f"{self.icons_dir}/close_FILL0_wght400_GRAD0_opsz24.svg",
 			size=(CUSTOM_BAR_HEIGHT, CUSTOM_BAR_HEIGHT),
-			style=th.get_style("custom_bar_close_button_style"),
 			callback=self.close_window
 		)
+		self.close_button.setObjectName("custom_bar_close_button")
 
 		# Layout
 		custom_bar_layout.addWidget(self.logo_button)
@@ -173,17 +173,6 @@ class SSCWindowProperties(QMainWindow):
 			self.showFullScreen()
 
 	def callback_update_theme(self, theme):
-		
-		# Reload stylesheets (background for SVG buttons)
-		self.custom_bar_widget.setStyleSheet(th.get_style("custom_bar_widget_style"))
-		self.logo_button.setStyleSheet(th.get_style("custom_bar_button_style"))
-		self.title_label.setStyleSheet(th.get_style("custom_bar_button_style"))
-		self.color_mode_button.setStyleSheet(th.get_style("custom_bar_button_style"))
-		self.top_hint_button.setStyleSheet(th.get_style("custom_bar_button_style"))
-		self.minimize_button.setStyleSheet(th.get_style("custom_bar_button_style"))
-		self.fullscreen_button.setStyleSheet(th.get_style("custom_bar_button_style"))
-		self.close_button.setStyleSheet(th.get_style("custom_bar_close_button_style"))
-
 		# Update special widgets by theme
 		if theme == "dark":
 			self.logo_button.changeIconColor("#ffffff")
@@ -1,32 +1,78 @@
 # Desc: Style changer helper for multiple themes
 # This file is part of ArcticStream Library.
 
-from resources.theme_dark import *
-from resources.theme_light import *
+import functools
+import importlib
+import re
+from string import Template
+
+from resources import theme_template
 
 dark_theme_selected = True  # Initial flag for theme
 
-def get_style(style_names):
+# Whitespace runs, and whitespace around QSS punctuation
+style_spaces = re.compile(r"\s+")
+style_punctuation_spaces = re.compile(r"\s*([{}:;,])\s*")
+
+# Application styles, widgets pick their own rules by object name or state
+app_style_names = [
+	"default_app_style",
+	"custom_bar_widget_style",
+	"default_button_style",
+	"custom_bar_button_style",
+	"custom_bar_close_button_style",
+	"custom_bar_status_button_style",
+	"connectors_button_style",
+	"connectors_desc_button_style",
+	"default_line_edit_style",
+	"console_send_line_edit_style",
+	"console_status_line_edit_style",
+	"updater_placeholder_line_edit_style",
+	"debug_bar_line_edit_style",
+	"default_text_edit_style",
+	"default_ptext_edit_style",
+	"updater_highligh_ptext_edit_style",
+	"default_tab_style",
+	"default_scroll_style",
+	"default_loading_bar_style",
+	"uploader_loading_bar_fail_style"
+]
+
+def load_theme(theme):
 	"""
-	Fetches and concatenates the appropriate style strings based on the current theme.
-	Accepts both a single style name or a list of style names.
+	Imports a theme palette on first use, the inactive theme is not loaded until the user toggles to it.
 	"""
-	global dark_theme_selected
-	styles = ""
+	return importlib.import_module(f"resources.theme_{theme}")
 
-	# Ensure style_names is a list even if a single style name is provided
-	if not isinstance(style_names, list):
-		style_names = [style_names]
+def get_app_style():
+	"""
+	Returns the application stylesheet of the current theme.
+	"""
+	return build_app_style("dark" if dark_theme_selected else "light")
 
-	for style_name in style_names:
-		if dark_theme_selected:
-			module = __import__("resources.theme_dark", fromlist=[style_name])
-		else:
-			module = __import__("resources.theme_light", fromlist=[style_name])
-		
-		styles += getattr(module, style_name, "")
+@functools.lru_cache(maxsize=2)
+def build_app_style(theme):
+	"""
+	Fills the shared style template with the palette and declarations of a theme, built once per theme and reused on every toggle.
+	"""
+	module = load_theme(theme)
+	template = "".join(getattr(theme_template, style_name, "") for style_name in app_style_names)
+	return minify_style(Template(template).substitute(module.palette, **module.declarations))
+
+def minify_style(style):
+	"""
+	Drops the indentation and spacing of a stylesheet, Qt gets the same rules in fewer characters.
+	"""
+	return style_punctuation_spaces.sub(r"\1", style_spaces.sub(" ", style)).strip()
 
-	return styles
+def set_style_state(widget, state, value):
+	"""
+	Sets a dynamic property matched by the stylesheet selectors and repolishes the widget.
+	Lets a widget change its look without a stylesheet of its own.
+	"""
+	widget.setProperty(state, value)
+	widget.style().unpolish(widget)
+	widget.style().polish(widget)
 
 def toggle_theme():
 	"""
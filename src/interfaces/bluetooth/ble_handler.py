@@ -29,7 +29,7 @@ class BLEHandler(QObject):
 	connectionCompleted = pyqtSignal(bool)
 	deviceDisconnected = pyqtSignal(object)
 	characteristicRead = pyqtSignal(str, bytes)
-	notificationReceived = pyqtSignal(str, str)
+	notificationReceived = pyqtSignal(str, bytes)
 	writeCompleted = pyqtSignal(bool)
 
 	def __init__(self):
@@ -86,11 +86,10 @@ class BLEHandler(QObject):
 			print(f"Write failed: {e}")
 			self.writeCompleted.emit(False)
 
-	# Callback for notifications
+	# Callback for notifications (raw payload, decoded only by the receiver it belongs to)
 	def notificationCallback(self, sender, data):
 		sender_info = sender.uuid if hasattr(sender, 'uuid') else str(sender)
-		decoded_data = data.decode('utf-8', errors='replace') if isinstance(data, (bytearray, bytes)) else str(data)
-		self.notificationReceived.emit(sender_info, decoded_data)
+		self.notificationReceived.emit(sender_info, bytes(data))
 
 	# Callback disconnected
 	def onDisconnected(self, client):
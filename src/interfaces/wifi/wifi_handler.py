@@ -7,6 +7,18 @@ from PyQt5.QtCore import QObject, pyqtSignal
 import asyncio
 import qasync
 
+# Size of the preallocated receive buffer of each characteristic socket
+RECEIVE_BUFFER_SIZE = 64 * 1024
+
+# Type of service for low delay traffic (RFC 1349)
+IPTOS_LOWDELAY = 0x10
+
+# Seconds a send may take before the socket is dropped (zero window or lost peer)
+SEND_TIMEOUT = 5
+
+# TCP keepalive tuning for idle connections: idle time (s), probe interval (s) and probe count before the peer is dropped
+TCP_KEEPALIVE_OPTIONS = (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+
 class WiFiHandler(QObject):
 	connectionCompleted = pyqtSignal(bool)
 	dataReceived = pyqtSignal(str)
@@ -15,49 +27,106 @@ class WiFiHandler(QObject):
 	def __init__(self):
 		super().__init__()
 		self.client_sockets = {}
+		self.receive_buffers = {} # Reused by every receive, no per-call allocation
+		self.send_locks = {} # Serializes concurrent sends on the same socket
 		self.host_ip = "192.168.1.23"
 		self.ports = {"char1": 10001, "char2": 10002}
 
 	@qasync.asyncSlot()
 	async def connectToServer(self):
 		try:
-			for char, port in self.ports.items():
-				client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-				await asyncio.wait_for(client_socket.connect((self.host_ip, port)), timeout=5)
+			# All characteristic ports are connected concurrently
+			results = await asyncio.gather(*(self.open_socket(port) for port in self.ports.values()), return_exceptions=True)
+			errors = [result for result in results if isinstance(result, Exception)]
+			if errors:
+				for result in results:
+					if not isinstance(result, Exception):
+						result.close()
+				raise errors[0]
+
+			for char, client_socket in zip(self.ports, results):
 				self.client_sockets[char] = client_socket
+				self.receive_buffers[char] = memoryview(bytearray(RECEIVE_BUFFER_SIZE))
+				self.send_locks[char] = asyncio.Lock()
 			self.connectionCompleted.emit(True)
 		except Exception as e:
 			print(f"Connection failed: {e}")
 			self.connectionCompleted.emit(False)
 
+	# Open a socket to a single characteristic port
+	async def open_socket(self, port):
+		client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		client_socket.setblocking(False) # Driven by the event loop, never blocks the GUI
+		client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) # Small writes are sent right away
+		client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) # Idle connections to a vanished peer are dropped by the OS
+		for name, value in TCP_KEEPALIVE_OPTIONS:
+			option = getattr(socket, name, None) # Not every platform exposes every option
+			if option is None:
+				continue
+			try:
+				client_socket.setsockopt(socket.IPPROTO_TCP, option, value)
+			except OSError:
+				pass # Defined but rejected on some platforms, the OS defaults are kept
+		try:
+			client_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, IPTOS_LOWDELAY)
+		except (AttributeError, OSError):
+			pass # Not available or not honoured on every platform
+		try:
+			await asyncio.wait_for(asyncio.get_running_loop().sock_connect(client_socket, (self.host_ip, port)), timeout=5)
+		except Exception:
+			client_socket.close()
+			raise
+		return client_socket
+
 	@qasync.asyncSlot()
 	async def sendData(self, char, data):
 		try:
 			client_socket = self.client_sockets.get(char)
 			if client_socket:
-				await asyncio.wait_for(client_socket.send(data), timeout=5)
+				# The deadline covers the wait for the lock too, a stalled send never blocks the next ones for good
+				await asyncio.wait_for(self.send_locked(self.send_locks[char], client_socket, data), timeout=SEND_TIMEOUT)
 				self.writeCompleted.emit(True)
 			else:
 				print(f"No socket for characteristic: {char}")
 				self.writeCompleted.emit(False)
+		except asyncio.TimeoutError:
+			print(f"Send timed out on characteristic: {char}")
+			self.close_socket(char, client_socket) # Partially sent data leaves the stream unusable
+			self.writeCompleted.emit(False)
 		except Exception as e:
 			print(f"Send failed: {e}")
 			self.writeCompleted.emit(False)
 
+	# Serializes concurrent sends on the same socket
+	async def send_locked(self, send_lock, client_socket, data):
+		async with send_lock:
+			await asyncio.get_running_loop().sock_sendall(client_socket, data)
+
 	@qasync.asyncSlot()
 	async def receiveData(self, char):
 		try:
 			client_socket = self.client_sockets.get(char)
 			if client_socket:
-				data = await asyncio.wait_for(client_socket.recv(1024), timeout=5)
-				self.dataReceived.emit(data.decode())
+				buffer = self.receive_buffers[char]
+				size = await asyncio.wait_for(asyncio.get_running_loop().sock_recv_into(client_socket, buffer), timeout=5)
+				self.dataReceived.emit(str(buffer[:size], "utf-8"))
 			else:
 				print(f"No socket for characteristic: {char}")
 		except Exception as e:
 			print(f"Receive failed: {e}")
 
+	# Close a single characteristic socket, unless it was already replaced by a new connection
+	def close_socket(self, char, client_socket):
+		client_socket.close()
+		if self.client_sockets.get(char) is client_socket:
+			del self.client_sockets[char]
+			self.receive_buffers.pop(char, None)
+			self.send_locks.pop(char, None) # Sends still queued on the old lock fail on the closed socket or time out
+
 	@qasync.asyncSlot()
 	async def disconnect(self):
 		for client_socket in self.client_sockets.values():
 			client_socket.close()
-		self.client_sockets.clear()
\ No newline at end of file
+		self.client_sockets.clear()
+		self.receive_buffers.clear()
+		self.send_locks.clear()
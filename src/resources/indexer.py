@@ -2,12 +2,16 @@
 # This file is part of ArcticStream Library.
 
 class BackgroundIndex:
+	__slots__ = ("service", "tx_characteristic", "rx_characteristic")
+
 	def __init__(self, service):
 		self.service = service
 		self.tx_characteristic = None
 		self.rx_characteristic = None
 
 class OTAIndex:
+	__slots__ = ("service", "tx_characteristic", "rx_characteristic", "name")
+
 	def __init__(self, service):
 		self.service = service
 		self.tx_characteristic = None
@@ -15,6 +19,8 @@ class OTAIndex:
 		self.name = None
 
 class ConsoleIndex:
+	__slots__ = ("service", "tx_characteristic", "txs_characteristic", "rx_characteristic", "name")
+
 	def __init__(self, service):
 		self.service = service
 		self.tx_characteristic = None
@@ -17,4 +17,10 @@ char_ota_rx_uuid= "4fafc201-1fb5-459e-2000-c5c9c3319b00"
 service_console_pattern = re.compile(r"4fafc201-1fb5-459e-30[0-9a-fA-F]{2}-c5c9c3319f[0-9a-fA-F]{2}")
 char_tx_pattern = re.compile(r"4fafc201-1fb5-459e-30[0-9a-fA-F]{2}-c5c9c3319a[0-9a-fA-F]{2}")
 char_txs_pattern = re.compile(r"4fafc201-1fb5-459e-30[0-9a-fA-F]{2}-c5c9c3319b[0-9a-fA-F]{2}")
-char_rx_pattern = re.compile(r"4fafc201-1fb5-459e-30[0-9a-fA-F]{2}-c5c9c3319c[0-9a-fA-F]{2}")
\ No newline at end of file
+char_rx_pattern = re.compile(r"4fafc201-1fb5-459e-30[0-9a-fA-F]{2}-c5c9c3319c[0-9a-fA-F]{2}")
+
+# Bound matchers for the console patterns
+service_console_match = service_console_pattern.match
+char_tx_match = char_tx_pattern.match
+char_txs_match = char_txs_pattern.match
+char_rx_match = char_rx_pattern.match
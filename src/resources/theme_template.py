@@ -0,0 +1,336 @@
+# Desc: Style template shared by every theme
+# This file is part of ArcticStream Library.
+
+# Placeholders ($background, $text, ...) are filled from the palette of each theme module
+
+default_app_style = """
+	QMainWindow {
+		background-color: $background;
+	}
+	QListWidget {
+		background-color: $background;
+		color: $text;
+		font-size: 12px;
+		
+		margin: 0px;
+		padding: 8px;
+		
+		border: none;
+		border-radius: 4px;
+	}
+	QLabel {
+		color: $text;
+		font-size: 13px;
+	}
+"""
+
+# QWidgets --------------------------------
+
+custom_bar_widget_style = """
+	QWidget#custom_bar_widget {
+		background-color: $surface;
+	}
+"""
+
+# Push buttons ----------------------------
+
+# Hover and pressed states shared by the themed buttons
+def button_states(selector):
+	return f"""
+	{selector}:hover {{
+		background-color: $hover;
+	}}
+	{selector}:pressed {{
+		background-color: $pressed;
+	}}
+"""
+
+default_button_style = """
+	QPushButton {
+		background-color: $surface;
+		color: $button_text;
+		font-size: 12px;
+		
+		$button_size
+	}""" + button_states("QPushButton")
+
+custom_bar_button_style = """
+	QPushButton#custom_bar_button {
+		background-color: $surface;
+		color: $button_text;
+		border-radius: 0px;
+	}""" + button_states("QPushButton#custom_bar_button")
+
+custom_bar_close_button_style = """
+	QPushButton#custom_bar_close_button {
+		background-color: $surface;
+		color: $button_text;
+		border-radius: 0px;
+	}
+	QPushButton#custom_bar_close_button:hover {
+		background-color: red;
+	}
+	QPushButton#custom_bar_close_button:pressed {
+		background-color: darkred;
+	}
+"""
+
+custom_bar_status_button_style = """
+	QPushButton#con_status_button {
+		background-color: $surface;
+		color: white;
+		font-size: 13px;
+		border-radius: 0px;
+	}
+	QPushButton#con_status_button[status="connected"] {
+		background-color: rgba(0, 100, 0, 128);
+	}
+	QPushButton#con_status_button[status="disconnected"] {
+		background-color: rgba(139, 0, 0, 128);
+	}
+"""
+
+connectors_button_style = """
+	QPushButton#connectors_button {
+		background-color: $surface;
+		color: $button_text;
+		$connectors_radius
+		border-top-left-radius: 30px;
+		border-top-right-radius: 30px;
+		border-bottom-left-radius: 0px;
+		border-bottom-right-radius: 0px;
+	}""" + button_states("QPushButton#connectors_button")
+
+connectors_desc_button_style = """
+	QPushButton#connectors_desc_button {
+		background-color: $surface;
+		color: $button_text;
+        
+		border-top-left-radius: 0px;
+		border-top-right-radius: 0px;
+		border-bottom-left-radius: 30px;
+		border-bottom-right-radius: 30px;
+	}""" + button_states("QPushButton#connectors_desc_button")
+
+# QLineEdit ----------------------------
+
+default_line_edit_style = """
+	QLineEdit {
+		background-color: $background;
+		color: $text;
+		font-size: 12px;
+		
+		margin: 0px;
+		padding: 4px;
+		
+		border: none;
+		border-radius: 4px;
+	}
+"""
+
+console_send_line_edit_style = """
+	QLineEdit#console_send_line_edit {
+		background-color: $input;
+		color: $button_text;
+		font-size: 12px;
+	}
+"""
+
+console_status_line_edit_style = """
+	QLineEdit#console_status_line_edit {
+		background-color: $overlay;
+		color: $button_text;
+		font-size: 12px;
+        
+        border: none;
+		border-top-left-radius: 8px;
+		border-top-right-radius: 8px;
+		border-bottom-left-radius: 0px;
+		border-bottom-right-radius: 0px;
+	}
+"""
+
+updater_placeholder_line_edit_style = """
+	QLineEdit#updater_placeholder_line_edit {
+		background: transparent;
+		color: gray;
+		$placeholder_font
+	}
+"""
+
+debug_bar_line_edit_style = """
+	QLineEdit#debug_bar_line_edit {
+		background-color: $panel;
+		color: $text;
+		font-size: 10px;
+	}
+"""
+
+# QTextEdit ----------------------------
+
+default_text_edit_style = """
+	QTextEdit {
+		background-color: $text_edit_background;
+		color: $text_edit_text;
+		font-size: 12px;
+		
+		padding: 8px;
+		margin: 0px;
+		
+		border: none;
+		border-radius: 4px;
+	}
+"""
+
+default_ptext_edit_style = """
+	QPlainTextEdit {
+		background-color: $background;
+		color: $text;
+		font-size: 12px;
+		
+		padding: 8px;
+		margin: 0px;
+		
+		border: none;
+		border-radius: 4px;
+	}
+"""
+
+updater_highligh_ptext_edit_style = """
+	QPlainTextEdit[highlight="true"] {
+		background-color: rgba(150, 150, 150, 0.5);
+	}
+"""
+
+# QTabWidget ----------------------------
+
+default_tab_style = """
+	QTabWidget::pane {
+		background-color: $panel;
+		
+		margin: 0px;
+		padding: 0px;
+		
+		border-bottom-right-radius: 4px;
+		border-bottom-left-radius: 4px;
+	}
+	QTabBar::tab {
+		background: $surface;
+		color: $text;
+		font-size: 12px;
+		
+		padding: 4px;
+		margin-right: 4px;
+		
+		border-top-left-radius: 4px;
+		border-top-right-radius: 4px;
+	}
+	QTabWidget::tab-bar {
+		alignment: left;
+	}
+	QTabBar::tab:hover {
+		background: $hover;
+	}
+	QTabBar::tab:selected {
+		background: $panel;
+		border-bottom-color: $panel;
+	}
+	QTabBar::tab:!selected {
+		margin-top: 2px;
+	}
+	QTabBar::scroller {
+		width: 20px;
+	}
+	QTabBar QToolButton {
+		background: $surface;
+		border: 1px solid $pressed;
+		border-radius: 4px;
+	}
+	QTabBar QToolButton:hover {
+		background: $hover;
+	}
+"""
+
+# Scroll bars ----------------------------
+
+default_scroll_style = """
+	QScrollBar:vertical {
+		border: none;
+		background-color: $panel;
+		width: 8px;
+	}
+	QScrollBar::handle:vertical {
+		background-color: $input;
+		min-height: 20px;
+	}
+	QScrollBar::handle:vertical:hover {
+		background-color: $hover;
+	}
+	QScrollBar::sub-line:vertical, QScrollBar::add-line:vertical {
+		border: none;
+		background: none;
+		height: 0px;
+	}
+	QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+		background: none;
+	}
+	QScrollBar:horizontal {
+		border: none;
+		background-color: $panel;
+		height: 8px;
+		margin-bottom: 8px;
+	}
+	QScrollBar::handle:horizontal {
+		background-color: $input;
+		min-height: 20px;
+	}
+	QScrollBar::handle:horizontal:hover {
+		background-color: $hover;
+	}
+	QScrollBar::sub-line:horizontal, QScrollBar::add-line:horizontal {
+		border: none;
+		background: none;
+		height: 0px;
+	}
+	QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+		background: none;
+	}
+"""
+
+# Loading bar ----------------------------
+
+default_loading_bar_style = """
+	QProgressBar {
+		background-color: $input;
+		color: $button_text;
+		font-size: 12px;
+		
+		height: 26px;
+		padding: 0px;
+		border-radius: 4px;
+		
+		text-align: center;
+	}
+	QProgressBar::chunk {
+		background-color: rgba(0, 100, 0, 128);
+		border-radius: 4px;
+	}
+"""
+
+uploader_loading_bar_fail_style = """
+	QProgressBar[failed="true"] {
+		background-color: $input;
+		color: $button_text;
+		font-size: 12px;
+		
+		height: 26px;
+		padding: 0px;
+		border-radius: 4px;
+		
+		text-align: center;
+	}
+	QProgressBar[failed="true"]::chunk {
+		background-color: rgba(139, 0, 0, 128);
+		border-radius: 4px;
+	}
+"""
\ No newline at end of file